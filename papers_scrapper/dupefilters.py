@@ -0,0 +1,71 @@
+# Define here the duplicate request filters used by the spiders
+#
+# See documentation in:
+# https://docs.scrapy.org/en/latest/topics/settings.html#dupefilter-class
+
+import math
+from pathlib import Path
+
+from scrapy.dupefilters import RFPDupeFilter
+
+
+class BloomFilter:
+    # fixed-size probabilistic set of request fingerprints: membership tests may give false
+    # positives (at most error_rate while no more than capacity fingerprints were added), never
+    # false negatives
+    def __init__(self, capacity: int, error_rate: float):
+        # optimal number of bits and of hash functions for the given capacity and error rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, fingerprint: bytes):
+        # the fingerprints are already uniformly distributed hashes (sha1), so the bit positions
+        # are derived from them by double hashing instead of hashing them again
+        h1 = int.from_bytes(fingerprint[:8], 'little')
+        h2 = int.from_bytes(fingerprint[8:16], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, fingerprint: bytes) -> bool:
+        # adds the fingerprint and returns whether it was (probably) already in the set
+        seen = True
+        for position in self._positions(fingerprint):
+            index, mask = position >> 3, 1 << (position & 7)
+            if not self.bits[index] & mask:
+                self.bits[index] |= mask
+                seen = False
+        return seen
+
+
+class BloomRFPDupeFilter(RFPDupeFilter):
+    """
+    Same as Scrapy's RFPDupeFilter, but the seen fingerprints are kept in a Bloom filter instead of a
+    set, so its memory use is fixed (~1.8MB for the default capacity) whatever the number of requests.
+    A false positive drops a request that was never made, which is unlikely (below error_rate) as long
+    as the crawl makes fewer than capacity requests.
+    """
+    capacity = 1_000_000
+    error_rate = 0.001
+
+    def __init__(self, path=None, debug=False, *, fingerprinter=None):
+        # the parent class doesn't get the JOBDIR, it would load its requests.seen file in a set
+        super().__init__(None, debug, fingerprinter=fingerprinter)
+        self.bloom = BloomFilter(self.capacity, self.error_rate)
+        # the bit set is saved in a file of its own when the crawl is paused, the format of requests.seen
+        # is private to RFPDupeFilter and changes between Scrapy versions
+        self.bloom_path = Path(path, 'requests.bloom') if path else None
+        if self.bloom_path and self.bloom_path.exists():
+            bits = self.bloom_path.read_bytes()
+            if len(bits) == len(self.bloom.bits):
+                self.bloom.bits[:] = bits
+            else:
+                self.logger.warning(
+                    f'Ignoring {self.bloom_path}, it was saved with another capacity or error rate')
+
+    def request_seen(self, request) -> bool:
+        return self.bloom.add(self.fingerprinter.fingerprint(request))
+
+    def close(self, reason: str) -> None:
+        if self.bloom_path:
+            self.bloom_path.write_bytes(self.bloom.bits)
+        super().close(reason)
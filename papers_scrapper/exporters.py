@@ -0,0 +1,27 @@
+# Define here the item exporters used by the feed exports
+#
+# Don't forget to add your exporter to the FEED_EXPORTERS setting
+# See: https://docs.scrapy.org/en/latest/topics/exporters.html
+
+import orjson
+from scrapy.exporters import JsonLinesItemExporter
+
+
+class OrjsonLinesItemExporter(JsonLinesItemExporter):
+    # same as JsonLinesItemExporter, but each item is serialized to bytes by a single orjson call
+    # instead of the stdlib encoder + encoding the resulting str. orjson only writes UTF-8, so it's
+    # not used for feeds with another FEED_EXPORT_ENCODING (non ascii characters are written as
+    # they are instead of being escaped, the JSON values stay the same)
+    def __init__(self, file, **kwargs):
+        super().__init__(file, **kwargs)
+        self._use_orjson = (self.encoding or 'utf-8').lower().replace('-', '') == 'utf8'
+        # made public (get_serialized_fields) by newer Scrapy versions
+        self._serialized_fields = getattr(self, 'get_serialized_fields', None) or self._get_serialized_fields
+
+    def export_item(self, item):
+        if not self._use_orjson:
+            return super().export_item(item)
+
+        itemdict = dict(self._serialized_fields(item))
+        # types orjson doesn't know (sets, decimals, ...) are converted the same way as Scrapy does
+        self.file.write(orjson.dumps(itemdict, default=self.encoder.default, option=orjson.OPT_APPEND_NEWLINE))
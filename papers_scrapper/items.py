@@ -3,16 +3,17 @@
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/items.html
 
-import scrapy
+from dataclasses import dataclass, field
 
 
-class PdfFilesItem(scrapy.Item):
+@dataclass(slots=True)
+class PdfFilesItem:
     # the name of the field to host url for the file to be
     # downloaded must have name 'file_urls'
-    abstract = scrapy.Field()
-    abstract_url = scrapy.Field()
-    authors = scrapy.Field()
-    file_urls = scrapy.Field() # used to download the pdfs
-    pdf_url = scrapy.Field()
-    source_url = scrapy.Field()
-    title = scrapy.Field()
+    abstract: str = ''
+    abstract_url: str = ''
+    authors: str = ''
+    file_urls: list[str] = field(default_factory=list) # used to download the pdfs
+    pdf_url: str = ''
+    source_url: int | str = ''
+    title: str = ''
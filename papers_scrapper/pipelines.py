@@ -20,6 +20,13 @@ _logger = logging.getLogger(__name__)
 
 
 class PdfFilesPipeline(FilesPipeline):
+    def get_media_requests(self, item, info):
+        # pdfs are already kept in FILES_STORE, don't store a second copy when HTTPCACHE is enabled
+        requests = super().get_media_requests(item, info)
+        for request in requests:
+            request.meta['dont_cache'] = True
+        return requests
+
     def file_path(
             self,
             request: scrapy.http.Request,
@@ -36,6 +43,10 @@ class PdfFilesPipeline(FilesPipeline):
 
 
 class TsvExportPipeline:
+    # the exporter writes each row through to the file, a larger write buffer than the default (8KB)
+    # makes it reach the disk once per few hundred rows instead of every few rows (abstracts are long)
+    write_buffer_size = 512 * 1024
+
     def __init__(self, file_name: str, fields: list[str], delimiter: str='\t'):
         self._delimiter = delimiter
         self._file_name = file_name
@@ -50,7 +61,7 @@ class TsvExportPipeline:
             _logger.debug(f'Creating directory {save_dir}')
             save_dir.mkdir(parents=True)
 
-        self.file_handler = open(paper_infos_path, 'wb')
+        self.file_handler = open(paper_infos_path, 'wb', buffering=self.write_buffer_size)
         self.csv_exporter = CsvItemExporter(
             self.file_handler, fields_to_export=self._fields_to_export, delimiter=self._delimiter)
         self.csv_exporter.start_exporting()
@@ -60,12 +71,12 @@ class TsvExportPipeline:
         self.file_handler.close()
 
     def process_item(self, item: PdfFilesItem, spider: scrapy.spiders.Spider):
-        if item['authors'] is not None:
-            item['authors'] = item['authors'].replace('*', '')
-            item['authors'] = item['authors'].replace(' ,', ',')
-            item['authors'] = item['authors'].replace(', and ', ', ')
-            item['authors'] = item['authors'].replace(' and ', ', ')
-            item['authors'] = item['authors'].replace(' & ', ', ')
+        if item.authors is not None:
+            item.authors = item.authors.replace('*', '')
+            item.authors = item.authors.replace(' ,', ',')
+            item.authors = item.authors.replace(', and ', ', ')
+            item.authors = item.authors.replace(' and ', ', ')
+            item.authors = item.authors.replace(' & ', ', ')
         self.csv_exporter.export_item(item)
         return item
 
@@ -30,6 +30,7 @@ ROBOTSTXT_OBEY = False
 DOWNLOAD_DELAY = 2.5
 # The download delay setting will honor only one of:
 CONCURRENT_REQUESTS_PER_DOMAIN = 5
+# (the per domain value also sizes the pool of keep-alive connections reused for each host)
 #CONCURRENT_REQUESTS_PER_IP = 16
 
 # Disable cookies (enabled by default)
@@ -77,6 +78,15 @@ ITEM_PIPELINES = {
 
 FILES_STORE = str(Path('data').resolve())
 
+# Configure feed exporters (e.g. scrapy crawl <spider> -o papers.jsonl)
+# See https://docs.scrapy.org/en/latest/topics/feed-exports.html#feed-exporters
+# JSON lines are serialized with orjson, which only writes UTF-8: unless FEED_EXPORT_ENCODING is set
+# to another encoding, non ascii text is written as is instead of \u-escaped like Scrapy's exporter does
+FEED_EXPORTERS = {
+    'jsonlines': 'papers_scrapper.exporters.OrjsonLinesItemExporter',
+    'jsonl': 'papers_scrapper.exporters.OrjsonLinesItemExporter',
+}
+
 # days of delay for files expiration
 FILES_EXPIRES = 180
 
@@ -105,3 +115,6 @@ FILES_EXPIRES = 180
 # https: // docs.scrapy.org/en/latest/topics/logging.html
 LOG_ENABLED = True
 LOG_LEVEL = 'DEBUG'
+
+# Set settings whose default value is deprecated to a future-proof value
+REQUEST_FINGERPRINTER_IMPLEMENTATION = '2.7'
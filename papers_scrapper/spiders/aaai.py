@@ -76,13 +76,13 @@ class AAAISpider(BaseSpider):
 
             item = PdfFilesItem()
             if not abstract_link.endswith('/'):
-                item['abstract_url'] = abstract_link.split('/')[-1]
+                item.abstract_url = abstract_link.split('/')[-1]
             else:
-                item['abstract_url'] = abstract_link.split('/')[-2]
-            item['title'] = title
-            item['authors'] = authors.strip()
+                item.abstract_url = abstract_link.split('/')[-2]
+            item.title = title
+            item.authors = authors.strip()
 
-            if len(item['authors']) == 0:
+            if len(item.authors) == 0:
                 self.logger.debug(f'Could not find authors for {title}')
                 continue
 
@@ -125,14 +125,14 @@ class AAAISpider(BaseSpider):
 
         self.logger.debug(f'Abstract text: {abstract}')
         # might contain \r in abstract text, like \rightarrow
-        item['abstract'] = repr(abstract)
-        item['file_urls'] = [file_url]  # used to download pdf
-        item['pdf_url'] = pdf_url
-        item['title'] = self.clean_html_tags(item['title'])
-        item['title'] = self.clean_extra_whitespaces(item['title'])
-        item['title'] = self.clean_quotes(item['title'])
-        item['source_url'] = 1
-
-        self.check_abstract_is_complete(item["title"], abstract, response.url)
+        item.abstract = repr(abstract)
+        item.file_urls = [file_url]  # used to download pdf
+        item.pdf_url = pdf_url
+        item.title = self.clean_html_tags(item.title)
+        item.title = self.clean_extra_whitespaces(item.title)
+        item.title = self.clean_quotes(item.title)
+        item.source_url = 1
+
+        self.check_abstract_is_complete(item.title, abstract, response.url)
 
         yield item
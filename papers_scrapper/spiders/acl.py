@@ -67,8 +67,8 @@ class ACLSpider(BaseSpider):
                     abstract_link = abstract_link[1:]
                 if abstract_link.endswith('/'):
                     abstract_link = abstract_link[:-1]
-                item['abstract_url'] = abstract_link
-                item['title'] = title
+                item.abstract_url = abstract_link
+                item.title = title
                 self.logger.debug(f'Found abstract link for {title}: {abstract_url}')
 
                 yield scrapy.Request(url=abstract_url,
@@ -87,11 +87,11 @@ class ACLSpider(BaseSpider):
                 file_url = response.xpath('//*[@id="main"]/div[3]/div[2]/a[1]/@href').get()
 
         if file_url is None or len(file_url) < 5:
-            self.logger.warning(f'No PDF found for "{item["title"]}": {item["abstract_url"]}')
+            self.logger.warning(f'No PDF found for "{item.title}": {item.abstract_url}')
             return
 
-        item['file_urls'] = [file_url] # used to download pdf
-        item['pdf_url'] = file_url.replace('https://aclanthology.org/', '')
+        item.file_urls = [file_url] # used to download pdf
+        item.pdf_url = file_url.replace('https://aclanthology.org/', '')
 
         abstract = response.xpath('//*[@id="main"]/div[1]/div[1]/div/div/text()').get()
 
@@ -102,7 +102,7 @@ class ACLSpider(BaseSpider):
                 abstract = response.xpath('//*[@id="main"]/div[3]/div[1]/div/div/span').get()
 
                 if abstract is None:
-                    self.logger.warning(f'No abstract found for "{item["title"]}": {item["abstract_url"]}')
+                    self.logger.warning(f'No abstract found for "{item.title}": {item.abstract_url}')
                     return
 
         abstract = abstract.strip()
@@ -125,15 +125,15 @@ class ACLSpider(BaseSpider):
         abstract = self.clean_extra_whitespaces(abstract)
         abstract = self.clean_quotes(abstract)
 
-        item['title'] = self.clean_html_tags(item['title'])
-        item['title'] = self.clean_extra_whitespaces(item['title'])
-        item['title'] = self.clean_quotes(item['title'])
+        item.title = self.clean_html_tags(item.title)
+        item.title = self.clean_extra_whitespaces(item.title)
+        item.title = self.clean_quotes(item.title)
 
         authors = response.xpath('//*[@id="main"]/div[1]/p/a/text()').getall()
-        item['authors'] = ', '.join(authors).strip()
+        item.authors = ', '.join(authors).strip()
 
         self.logger.debug(f'Abstract text: {abstract}')
         # might contain \r in abstract text, like \rightarrow
-        item['abstract'] = repr(abstract)
-        item['source_url'] = 2
+        item.abstract = repr(abstract)
+        item.source_url = 2
         yield item
@@ -34,6 +34,7 @@ class BaseSpider(CrawlSpider):
         self._html_regex = re.compile('|'.join(html_regex))
         self._html_with_attributes_regex = re.compile(r'<[\w\s_\-\−\–=\"]+>')
         self._special_chars_regex = re.compile('[\s]*<(/)?[\w\s_\-\−\–=\"]+(/)?>[\s]*')
+        self._whitespaces_regex = re.compile(r'\s+')
         
         print("CONFERENCE IS ", conference)
         print("-------------------------------------------------")
@@ -48,8 +49,8 @@ class BaseSpider(CrawlSpider):
         return self._special_chars_regex.sub(' ', text).strip()
 
     def clean_extra_whitespaces(self, text: str) -> str:
-        text = ' '.join(t for t in text.split('\n') if len(t.strip()) > 0).strip()
-        return ' '.join(t for t in text.split() if len(t.strip()) > 0).strip()
+        # collapse every run of whitespaces (line breaks included) into a single space in one pass
+        return self._whitespaces_regex.sub(' ', text).strip()
 
     def clean_quotes(self, text: str) -> str:
         while (text.startswith('"') and text.endswith('"')) or (text.startswith("'") and text.endswith("'")):
@@ -57,7 +58,7 @@ class BaseSpider(CrawlSpider):
         return text
 
     def remove_line_breaks(self, text: str) -> str:
-        return ' '.join(t.strip() for t in text.split())
+        return self._whitespaces_regex.sub(' ', text).strip()
 
     def check_abstract_is_complete(self, title: str, abstract: str, url: str) -> None:
         if not abstract.endswith('.') and not abstract.split()[-1].startswith(('github', 'http')):
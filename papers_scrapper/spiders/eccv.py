@@ -34,12 +34,12 @@ class EccvSpider(BaseSpider):
                 abstract_url = response.urljoin(abstract_link)
                 pdf_url = response.urljoin(pdf_link)
                 item = PdfFilesItem()
-                item['abstract_url'] = abstract_link.replace(
+                item.abstract_url = abstract_link.replace(
                     f'papers/eccv_{self.year}/papers_ECCV/html/', '').replace('.php', '')
-                item['file_urls'] = [pdf_url]  # used to download pdf
-                item['pdf_url'] = pdf_link.replace(
+                item.file_urls = [pdf_url]  # used to download pdf
+                item.pdf_url = pdf_link.replace(
                     f'papers/eccv_{self.year}/papers_ECCV/papers/', '').replace('.pdf', '')
-                item['title'] = title.strip()
+                item.title = title.strip()
 
                 self.logger.debug(f'Found pdf url for {title}: {pdf_link}')
 
@@ -54,7 +54,7 @@ class EccvSpider(BaseSpider):
         abstract = response.xpath('//*[@id="abstract"]/text()').getall()
         if abstract is None:
             self.logger.warning(
-                f'No abstract found for "{item["title"]}": {item["abstract_url"]}')
+                f'No abstract found for "{item.title}": {item.abstract_url}')
             return
 
         abstract = ' '.join([a.strip() for a in abstract if len(a.strip()) > 0])
@@ -78,14 +78,14 @@ class EccvSpider(BaseSpider):
         abstract = self.clean_extra_whitespaces(abstract)
         abstract = self.clean_quotes(abstract)
 
-        item['authors'] = response.xpath('//*[@id="authors"]/b/i/text()').get().strip()
+        item.authors = response.xpath('//*[@id="authors"]/b/i/text()').get().strip()
 
-        item['title'] = self.clean_html_tags(item['title'])
-        item['title'] = self.clean_extra_whitespaces(item['title'])
-        item['title'] = self.clean_quotes(item['title'])
+        item.title = self.clean_html_tags(item.title)
+        item.title = self.clean_extra_whitespaces(item.title)
+        item.title = self.clean_quotes(item.title)
 
         self.logger.debug(f'Abstract text: {abstract}')
         # might contain \r in abstract text, like \rightarrow
-        item['abstract'] = repr(abstract)
-        item['source_url'] = 3
+        item.abstract = repr(abstract)
+        item.source_url = 3
         yield item
@@ -36,14 +36,14 @@ class IJCAISpider(BaseSpider):
             # "/proceedings/2021/1"
 
             item = PdfFilesItem()
-            item['abstract_url'] = abstract_link.replace(f'/proceedings/{self.year}/', '')
-            item['file_urls'] = [response.urljoin(file_url)] # used to download pdf
-            item['pdf_url'] = file_url
+            item.abstract_url = abstract_link.replace(f'/proceedings/{self.year}/', '')
+            item.file_urls = [response.urljoin(file_url)] # used to download pdf
+            item.pdf_url = file_url
 
-            item['title'] = title
-            item['title'] = self.clean_html_tags(item['title'])
-            item['title'] = self.clean_extra_whitespaces(item['title'])
-            item['title'] = self.clean_quotes(item['title'])
+            item.title = title
+            item.title = self.clean_html_tags(item.title)
+            item.title = self.clean_extra_whitespaces(item.title)
+            item.title = self.clean_quotes(item.title)
 
             subpage_url = response.urljoin(abstract_link)
             self.logger.debug(f'Found abstract link for {title}: {subpage_url}')
@@ -59,7 +59,7 @@ class IJCAISpider(BaseSpider):
         item = response.meta['item']
         abstract = response.xpath('//*[@id="block-system-main"]/div/div/div[3]/div[1]/text()').get()
         if abstract is None:
-            self.logger.warning(f'No abstract found for "{item["title"]}": {item["abstract_url"]}')
+            self.logger.warning(f'No abstract found for "{item.title}": {item.abstract_url}')
             return
 
         abstract = abstract.strip()
@@ -83,8 +83,8 @@ class IJCAISpider(BaseSpider):
 
         self.logger.debug(f'Abstract text: {abstract}')
         # might contain \r in abstract text, like \rightarrow
-        item['abstract'] = repr(abstract)
-        item['authors'] = response.xpath('//*[@id="block-system-main"]/div/div/div[1]/div[1]/h2/text()').get().strip()
-        item['source_url'] = 4
+        item.abstract = repr(abstract)
+        item.authors = response.xpath('//*[@id="block-system-main"]/div/div/div[1]/div[1]/h2/text()').get().strip()
+        item.source_url = 4
 
         yield item
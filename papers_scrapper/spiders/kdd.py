@@ -46,8 +46,8 @@ class KDDSpider(BaseSpider):
                 abstract_link = link.xpath('@href').get()
 
                 item = PdfFilesItem()
-                item['abstract_url'] = abstract_link.replace(replace_in_url, '')
-                item['title'] = title
+                item.abstract_url = abstract_link.replace(replace_in_url, '')
+                item.title = title
 
                 self.logger.debug(f'Found {abstract_link}')
                 yield scrapy.Request(
@@ -83,12 +83,12 @@ class KDDSpider(BaseSpider):
                 authors = ', '.join(authors)
 
                 item = PdfFilesItem()
-                # item['abstract_url'] = abstract_link.replace('https://dl.acm.org/doi/abs/', '')
-                item['abstract_url'] = abstract_link.replace('https://dl.acm.org/doi/', '')
-                item['abstract'] = repr(abstract_text)
-                item['authors'] = authors.strip()
-                item['title'] = title
-                item['source_url'] = 5
+                # item.abstract_url = abstract_link.replace('https://dl.acm.org/doi/abs/', '')
+                item.abstract_url = abstract_link.replace('https://dl.acm.org/doi/', '')
+                item.abstract = repr(abstract_text)
+                item.authors = authors.strip()
+                item.title = title
+                item.source_url = 5
                 yield item
 
     def parse_abstract(self, response: scrapy.http.TextResponse):
@@ -119,7 +119,7 @@ class KDDSpider(BaseSpider):
         abstract = self.clean_html_tags(abstract)
         abstract = self.clean_extra_whitespaces(abstract)
 
-        item['abstract'] = repr(abstract)
-        item['authors'] = authors.strip()
-        item['source_url'] = 5
+        item.abstract = repr(abstract)
+        item.authors = authors.strip()
+        item.source_url = 5
         yield item
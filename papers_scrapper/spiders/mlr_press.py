@@ -54,11 +54,11 @@ class MLRPressSpider(BaseSpider):
                 abstract_link = abstract_link[1:-1].strip()
 
             item = PdfFilesItem()
-            item['abstract_url'] = abstract_link.replace(self.start_urls[0], '')
-            item['abstract_url'] = '.'.join(item['abstract_url'].split('.')[:-1])
-            item['file_urls'] = [pdf_link]  # used to download pdf
-            item['pdf_url'] = pdf_link.replace(self.start_urls[0], '')
-            item['pdf_url'] = '/'.join(item['pdf_url'].split('/')[:-1])
+            item.abstract_url = abstract_link.replace(self.start_urls[0], '')
+            item.abstract_url = '.'.join(item.abstract_url.split('.')[:-1])
+            item.file_urls = [pdf_link]  # used to download pdf
+            item.pdf_url = pdf_link.replace(self.start_urls[0], '')
+            item.pdf_url = '/'.join(item.pdf_url.split('/')[:-1])
 
             yield scrapy.Request(url=abstract_link,
                                  callback=self.parse_abstract,
@@ -72,7 +72,7 @@ class MLRPressSpider(BaseSpider):
 
         if abstract is None:
             self.logger.warning(
-                f'No abstract found for: {item["abstract_url"]}')
+                f'No abstract found for: {item.abstract_url}')
             return
 
         abstract = abstract.strip()
@@ -98,15 +98,15 @@ class MLRPressSpider(BaseSpider):
 
         self.logger.debug(f'Abstract text: {abstract}')
         # might contain \r in abstract text, like \rightarrow
-        item['abstract'] = repr(abstract)
+        item.abstract = repr(abstract)
 
-        item['title'] = response.xpath('/html/body/main/div/article/h1/text()').get()
-        item['title'] = self.clean_html_tags(item['title'])
-        item['title'] = self.clean_extra_whitespaces(item['title'])
-        item['title'] = self.clean_quotes(item['title'])
+        item.title = response.xpath('/html/body/main/div/article/h1/text()').get()
+        item.title = self.clean_html_tags(item.title)
+        item.title = self.clean_extra_whitespaces(item.title)
+        item.title = self.clean_quotes(item.title)
 
-        item['authors'] = response.xpath('/html/body/main/div/article/span/text()').get().strip()
-        item['authors'] = item['authors'].replace('\xa0', ' ').strip()
-        item['source_url'] = 6
+        item.authors = response.xpath('/html/body/main/div/article/span/text()').get().strip()
+        item.authors = item.authors.replace('\xa0', ' ').strip()
+        item.source_url = 6
 
         yield item
@@ -1,11 +1,58 @@
+import re
+
 import scrapy
+from lxml import etree
+from scrapy.utils.response import get_base_url
+
 from .base_spider import BaseSpider
 from ..items import PdfFilesItem
+from ..utils import first, urljoin_cached
+
+
+# Based on: <a class="...button..." href="...">2025</a>
+_XP_YEAR_LINK = etree.XPath('//a[contains(@class, "wp-block-button__link") and normalize-space()=$y]/@href', smart_strings=False)
+# Based on: <a href="..."><strong>More details Accepted Papers</strong></a>
+_XP_ACCEPTED_PAPERS_LINK = etree.XPath('//a[strong[contains(text(), "Accepted Papers")]]/@href', smart_strings=False)
+# Based on: <a class="paper-link-abs" href="..."><span>More Details</span></a>
+_XP_PAPER_LINKS = etree.XPath('//a[@class="paper-link-abs"]/@href', smart_strings=False)
+# Based on: <a href="..."><strong>Read More</strong></a>
+_XP_PAPER_LINKS_OLD = etree.XPath('//a[strong[text()="Read More"]]/@href', smart_strings=False)
+
+# Based on: <meta property="og:title" content="Paper Title - NDSS Symposium">
+_TITLE_SUFFIX_REGEX = re.compile(r'\s*-\s*NDSS Symposium\s*$')
+
+
+def _own_text(element) -> list[str]:
+    # same as the text() XPath step: only the text nodes that are direct children of element
+    return [t for t in (element.text, *(child.tail for child in element)) if t is not None]
+
+
+def _first_own_text(element) -> str | None:
+    # same as text()[1], without going through the remaining text nodes
+    if element.text is not None:
+        return element.text
+    return next((child.tail for child in element if child.tail is not None), None)
+
 
 class NDSSSpider(BaseSpider):
     name = 'ndss'
     allowed_domains = ['ndss-symposium.org']
     start_urls = ['https://www.ndss-symposium.org/previous-ndss-symposia/']
+    custom_settings = {
+        # the NDSS site copes with more parallel requests than the project defaults. Autothrottle starts
+        # from DOWNLOAD_DELAY and aims at ~8 requests in flight, backing off if the site's latency goes up
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_START_DELAY': 0.25,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 8.0,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 16,
+        'DUPEFILTER_CLASS': 'papers_scrapper.dupefilters.BloomRFPDupeFilter',
+        'DOWNLOAD_DELAY': 0.25,
+        # keep the fetched pages for a day, so re-runs (e.g. after a failure) don't fetch them again
+        'HTTPCACHE_ENABLED': True,
+        'HTTPCACHE_EXPIRATION_SECS': 86400,
+        'HTTPCACHE_GZIP': True,
+        'HTTPCACHE_IGNORE_HTTP_CODES': [429, 500, 502, 503, 504],
+    }
 
     def __init__(self, conference: str = 'ndss', year: str = ''):
         BaseSpider.__init__(self, conference, year)
@@ -24,8 +71,7 @@ class NDSSSpider(BaseSpider):
         self.logger.info(f"Searching for year {self.year} on {response.url}")
 
         # Find the button/link for the specific year provided.
-        # Based on: <a class="...button..." href="...">2025</a>
-        year_link = response.xpath(f'//a[contains(@class, "wp-block-button__link") and normalize-space()="{self.year}"]/@href').get()
+        year_link = first(_XP_YEAR_LINK(response.selector.root, y=self.year))
         self.logger.debug(f"Year link found with primary XPat: {year_link}")
         
         if year_link:
@@ -45,8 +91,7 @@ class NDSSSpider(BaseSpider):
         self.logger.info(f"Searching for 'Accepted Papers' link on {response.url}")
         
         # Find the link that contains "Accepted Papers".
-        # Based on: <a href="..."><strong>More details Accepted Papers</strong></a>
-        accepted_papers_link = response.xpath('//a[strong[contains(text(), "Accepted Papers")]]/@href').get()
+        accepted_papers_link = first(_XP_ACCEPTED_PAPERS_LINK(response.selector.root))
 
         if accepted_papers_link:
             yield response.follow(accepted_papers_link, callback=self.parse_paper_list, meta=response.meta)
@@ -62,23 +107,31 @@ class NDSSSpider(BaseSpider):
         """
         self.logger.info(f"Parsing paper list on {response.url}")
 
+        # Pages with neither kind of link (e.g. error or rate-limit pages) are told apart by a plain
+        # bytes search, without parsing them
+        body = response.body
+        if b'paper-link-abs' not in body and b'Read More' not in body:
+            self.logger.error(f"Could not find any paper detail links on {response.url}. Spider stopping.")
+            return
+
+        root = response.selector.root
+
         # Primary selector for newer years
-        # Based on: <a class="paper-link-abs" href="..."><span>More Details</span></a>
-        links = response.xpath('//a[@class="paper-link-abs"]/@href').getall()
+        links = _XP_PAPER_LINKS(root)
 
         # Fallback selector for older years
-        # Based on: <a href="..."><strong>Read More</strong></a>
         if not links:
             self.logger.info("Primary selector failed, trying fallback selector for older years.")
-            links = response.xpath('//a[strong[text()="Read More"]]/@href').getall()
+            links = _XP_PAPER_LINKS_OLD(root)
 
         if not links:
             self.logger.error(f"Could not find any paper detail links on {response.url}. Spider stopping.")
             return
 
         self.logger.info(f"Found {len(links)} paper links to follow.")
-        for link in links:
-            yield response.follow(link, callback=self.parse_paper_details, meta=response.meta)
+        # the scheduler queue is LIFO by default, lower the priority of later links to crawl them in page order
+        for i, link in enumerate(links):
+            yield response.follow(link, callback=self.parse_paper_details, meta=response.meta, priority=-i)
 
     def parse_paper_details(self, response):
         """
@@ -86,40 +139,90 @@ class NDSSSpider(BaseSpider):
         """
         self.logger.info(f"Extracting details from {response.url}")
 
-        # Title (very robust)
-        # Based on: <meta property="og:title" content="...">
-        title = response.xpath('//meta[@property="og:title"]/@content').get()
+        # All fields are collected in a single walk over the document, instead of evaluating one XPath
+        # (i.e. one full traversal) per field and per fallback. The fallbacks for older years only keep
+        # the nodes they would read from, which are looked into only when the primary lookup fails.
+        title = None
+        authors = None
+        abstract_parts = []
+        pdf_url = None
+        authors_old_nodes = []
+        abstract_old_nodes = []
+        downloads_nodes = []
+        # parents whose children seen so far include a <strong> / an <h2>Abstract</h2>, so the
+        # following-sibling checks can be answered when a <p> is reached in document order
+        after_strong = set()
+        after_abstract_h2 = set()
+
+        for element in response.selector.root.iter('meta', 'strong', 'h2', 'p', 'a'):
+            tag = element.tag
+            if tag == 'meta':
+                # Title (very robust)
+                # Based on: <meta property="og:title" content="...">
+                if title is None and element.get('property') == 'og:title':
+                    title = element.get('content')
+
+            elif tag == 'strong':
+                # Authors
+                # Based on: <p><strong>Miaomiao Wang...</strong></p>
+                # only the first candidate is looked at, its text is checked after the walk
+                parent = element.getparent()
+                after_strong.add(parent)
+                if authors is None and parent.tag == 'p':
+                    authors = _first_own_text(element)
+
+            elif tag == 'h2':
+                if 'Abstract' in (_first_own_text(element) or ''):
+                    after_abstract_h2.add(element.getparent())
+
+            elif tag == 'p':
+                # Authors and PDF URL fallbacks
+                # Based on: <p class="ndss_authors">...</p> and <p class="ndss_downloads">...</p>
+                p_class = element.get('class')
+                if p_class == 'ndss_authors':
+                    authors_old_nodes.append(element)
+                elif p_class == 'ndss_downloads':
+                    downloads_nodes.append(element)
+
+                # Abstract (with fallback)
+                # Based on <p> after authors OR <p> after <h2>Abstract:</h2>
+                parent = element.getparent()
+                if parent in after_strong:
+                    abstract_parts.extend(_own_text(element))
+                elif parent in after_abstract_h2:
+                    abstract_old_nodes.append(element)
+
+            elif pdf_url is None and 'pdf-button' in element.get('class', ''):
+                # PDF URL
+                # Based on: <a class="...pdf-button...">
+                pdf_url = element.get('href')
 
-        # Authors (with fallback)
-        # Based on: <p><strong>Miaomiao Wang...</strong></p> OR <p class="ndss_authors">...</p>
-        authors = response.xpath('//p/strong/text()').get()
         if not authors or '(' not in authors: # Simple check to see if it's likely an author list
-             authors_raw = response.xpath('//p[@class="ndss_authors"]//text()').getall()
-             authors = ''.join(authors_raw).replace('Author(s):', '').strip()
+             # a nested ndss_authors paragraph is already part of the text of the outer one
+             nested = set(authors_old_nodes)
+             authors_raw = ''.join(
+                 text for node in authors_old_nodes if not any(e in nested for e in node.iterancestors())
+                 for text in node.itertext())
+             authors = authors_raw.replace('Author(s):', '').strip()
 
-        # Abstract (with fallback)
-        # Based on <p> after authors OR <p> after <h2>Abstract:</h2>
-        abstract_parts = response.xpath('//strong/following-sibling::p/text()').getall()
         if not abstract_parts:
-            abstract_parts = response.xpath('//h2[contains(text(), "Abstract")]/following-sibling::p/text()').getall()
-        abstract = ' '.join(p.strip() for p in abstract_parts)
+            abstract_parts = [text for node in abstract_old_nodes for text in _own_text(node)]
 
-        # PDF URL (with fallback)
-        # Based on: <a class="...pdf-button..." or <p class="ndss_downloads">
-        pdf_url = response.xpath('//a[contains(@class, "pdf-button")]/@href').get()
         if not pdf_url:
-            pdf_url = response.xpath('//p[@class="ndss_downloads"]//a/@href').get()
-
-        # Create and populate the final item
-        item = PdfFilesItem()
-        item['title'] = self.clean_quotes(title.replace('- NDSS Symposium', '').strip()) if title else ''
-        item['authors'] = self.clean_html_tags(authors).strip() if authors else ''
-        item['abstract'] = self.clean_extra_whitespaces(abstract) if abstract else ''
-        item['abstract_url'] = response.url
-        
-        full_pdf_url = response.urljoin(pdf_url) if pdf_url else ''
-        item['pdf_url'] = full_pdf_url
-        item['file_urls'] = [full_pdf_url] if full_pdf_url else []
-        item['source_url'] = 13 # A unique ID for NDSS
-
-        yield item
\ No newline at end of file
+            pdf_url = next((a.get('href') for node in downloads_nodes for a in node.iter('a') if 'href' in a.attrib), None)
+
+        # a single substitution over the joined paragraphs instead of stripping each one
+        abstract = self.clean_extra_whitespaces(' '.join(abstract_parts))
+
+        full_pdf_url = urljoin_cached(get_base_url(response), pdf_url) if pdf_url else ''
+
+        # Create the final item
+        yield PdfFilesItem(
+            title=self.clean_quotes(_TITLE_SUFFIX_REGEX.sub('', title).strip()) if title else '',
+            authors=self.clean_html_tags(authors).strip() if authors else '',
+            abstract=abstract,
+            abstract_url=response.url,
+            pdf_url=full_pdf_url,
+            file_urls=[full_pdf_url] if full_pdf_url else [],
+            source_url=13, # A unique ID for NDSS
+        )
\ No newline at end of file
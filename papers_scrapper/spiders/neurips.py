@@ -119,16 +119,16 @@ class NeuripsSpider(BaseSpider):
 
         item = PdfFilesItem()
         # might contain \r in abstract text, like \rightarrow
-        item['abstract'] = repr(abstract)
-        item['abstract_url'] = abstract_url.replace(
+        item.abstract = repr(abstract)
+        item.abstract_url = abstract_url.replace(
             f'https://papers.nips.cc/paper/{self.year}/hash/', '')
-        item['authors'] = authors.strip()
-        item['file_urls'] = [file_url] # used to download pdf
-        item['pdf_url'] = pdf_link.replace(
+        item.authors = authors.strip()
+        item.file_urls = [file_url] # used to download pdf
+        item.pdf_url = pdf_link.replace(
             f'/paper/{self.year}/file/', '')
-        item['title'] = title
-        item['title'] = self.clean_html_tags(item['title'])
-        item['title'] = self.clean_extra_whitespaces(item['title'])
-        item['title'] = self.clean_quotes(item['title'])
-        item['source_url'] = 7
+        item.title = title
+        item.title = self.clean_html_tags(item.title)
+        item.title = self.clean_extra_whitespaces(item.title)
+        item.title = self.clean_quotes(item.title)
+        item.source_url = 7
         yield item
@@ -1,6 +1,35 @@
+import re
+from urllib.parse import urlsplit
+
 import scrapy
+from lxml import etree
+from scrapy.utils.response import get_base_url
+
 from .base_spider import BaseSpider
 from ..items import PdfFilesItem
+from ..utils import first, meta_xpath, parse_with_target, urljoin_cached
+
+
+# looking for the meta tags where they're found avoids walking the whole (long) body
+_XP_TITLE = meta_xpath('@name="citation_title"')
+# all the authors are needed, and some of them may be anywhere in the document (see meta_xpath)
+_XP_AUTHORS = etree.XPath('//meta[@name="citation_author"]/@content', smart_strings=False)
+_XP_ABSTRACT = meta_xpath('@name="description"')
+_XP_PDF_URL = meta_xpath('@name="citation_pdf_url"')
+
+
+class _PaperLinksCollector:
+    # parser target collecting the same hrefs as //a[contains(@href, "/presentation")]/@href
+    def __init__(self):
+        self.links = []
+
+    def start(self, tag, attrib):
+        if tag == 'a' and '/presentation' in attrib.get('href', ''):
+            self.links.append(attrib['href'])
+
+    def close(self):
+        return self.links
+
 
 class OsdiSpider(BaseSpider):
     name = 'osdi'
@@ -8,9 +37,20 @@ class OsdiSpider(BaseSpider):
     start_urls = [
         'https://www.usenix.org/conference/osdi23/technical-sessions'
     ]
+    custom_settings = {
+        'DUPEFILTER_CLASS': 'papers_scrapper.dupefilters.BloomRFPDupeFilter',
+        # keep the fetched pages for a day, so re-runs (e.g. after a failure) don't fetch them again
+        'HTTPCACHE_ENABLED': True,
+        'HTTPCACHE_EXPIRATION_SECS': 86400,
+        'HTTPCACHE_GZIP': True,
+        'HTTPCACHE_IGNORE_HTTP_CODES': [429, 500, 502, 503, 504],
+    }
 
     def __init__(self, conference: str = 'osdi', year: str = '2023'):
         BaseSpider.__init__(self, conference, year)
+        # same host check as the offsite middleware, which would only drop the requests after they're built
+        domains = '|'.join(re.escape(domain) for domain in self.allowed_domains)
+        self._allowed_host_regex = re.compile(rf'^(.*\.)?({domains})$')
 
     def start_requests(self):
         for url in self.start_urls:
@@ -20,27 +60,34 @@ class OsdiSpider(BaseSpider):
     def parse(self, response):
         self.logger.info(f'Successfully fetched page: {response.url}')
         # Find all links to individual research papers (those containing '/presentation' or '/presentations')
-        paper_links = response.xpath('//a[contains(@href, "/presentation") or contains(@href, "/presentations")]/@href').getall()
+        # the same paper is usually linked more than once, so drop repeated hrefs keeping page order
+        # the links are taken straight from the parser events, no tree is built for the listing page
+        paper_links = list(dict.fromkeys(parse_with_target(response, _PaperLinksCollector())))
         if paper_links:
             self.logger.info(f'Found {len(paper_links)} research paper links')
-            for paper_url in paper_links:
-                abs_url = response.urljoin(paper_url)
-                yield scrapy.Request(url=abs_url, callback=self.parse_paper, dont_filter=True)
+            base_url = get_base_url(response)
+            paper_urls = (urljoin_cached(base_url, paper_url) for paper_url in paper_links)
+            yield from [
+                scrapy.Request(url=url, callback=self.parse_paper)
+                for url in paper_urls
+                if self._allowed_host_regex.match(urlsplit(url).hostname or '')
+            ]
         else:
             # If this is an individual paper page, extract info from meta tags
             yield from self.parse_paper(response)
 
     def parse_paper(self, response):
-        title = response.xpath('//meta[@name="citation_title"]/@content').get()
-        authors = response.xpath('//meta[@name="citation_author"]/@content').getall()
-        abstract = response.xpath('//meta[@name="description"]/@content').get()
-        pdf_url = response.xpath('//meta[@name="citation_pdf_url"]/@content').get()
-        item = PdfFilesItem()
-        item['title'] = self.clean_html_tags(title) if title else ''
-        item['authors'] = ', '.join(authors) if authors else ''
-        item['abstract'] = self.clean_html_tags(abstract) if abstract else ''
-        item['file_urls'] = [pdf_url] if pdf_url else []
-        item['pdf_url'] = pdf_url if pdf_url else ''
-        item['source_url'] = response.url
-        item['abstract_url'] = response.url
-        yield item
+        root = response.selector.root
+        title = first(_XP_TITLE(root))
+        authors = _XP_AUTHORS(root)
+        abstract = first(_XP_ABSTRACT(root))
+        pdf_url = first(_XP_PDF_URL(root))
+        yield PdfFilesItem(
+            title=self.clean_html_tags(title) if title else '',
+            authors=', '.join(authors) if authors else '',
+            abstract=self.clean_html_tags(abstract) if abstract else '',
+            file_urls=[pdf_url] if pdf_url else [],
+            pdf_url=pdf_url if pdf_url else '',
+            source_url=response.url,
+            abstract_url=response.url,
+        )
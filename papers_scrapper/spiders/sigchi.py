@@ -60,10 +60,10 @@ class SIGCHISpider(BaseSpider):
                 authors = authors_line
 
             item = PdfFilesItem()
-            item['abstract_url'] = abstract_link.replace('https://dl.acm.org/doi/abs/', '')
-            item['abstract_url'] = abstract_link.replace('https://dl.acm.org/doi/', '')
-            item['authors'] = authors.strip()
-            item['abstract'] = repr(abstract_text)
-            item['title'] = title
-            item['source_url'] = 8
+            item.abstract_url = abstract_link.replace('https://dl.acm.org/doi/abs/', '')
+            item.abstract_url = abstract_link.replace('https://dl.acm.org/doi/', '')
+            item.authors = authors.strip()
+            item.abstract = repr(abstract_text)
+            item.title = title
+            item.source_url = 8
             yield item
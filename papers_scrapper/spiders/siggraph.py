@@ -91,9 +91,9 @@ class SIGGRAPHSpider(BaseSpider):
                 continue
 
             item = PdfFilesItem()
-            item['abstract_url'] = link.replace('https://dl.acm.org/doi/', '')
-            item['abstract'] = repr(abstract_text)
-            item['authors'] = authors_text.strip()
-            item['title'] = title
-            item['source_url'] = 11
+            item.abstract_url = link.replace('https://dl.acm.org/doi/', '')
+            item.abstract = repr(abstract_text)
+            item.authors = authors_text.strip()
+            item.title = title
+            item.source_url = 11
             yield item
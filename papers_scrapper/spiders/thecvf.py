@@ -70,10 +70,10 @@ class TheCVFSpider(BaseSpider):
             self.logger.debug(f'Found pdf url for {title}: {file_url}')
 
             item = PdfFilesItem()
-            item['abstract_url'] = abstract_link.replace('../', '')
-            item['file_urls'] = [file_url] # used to download pdf
-            item['pdf_url'] = link.get().replace('../', '')
-            item['title'] = title
+            item.abstract_url = abstract_link.replace('../', '')
+            item.file_urls = [file_url] # used to download pdf
+            item.pdf_url = link.get().replace('../', '')
+            item.title = title
 
             yield scrapy.Request(url=abstract_url,
                                 callback=self.parse_abstract,
@@ -85,7 +85,7 @@ class TheCVFSpider(BaseSpider):
 
         abstract = response.xpath('//*[@id="abstract"]/text()').get()
         if abstract is None:
-            self.logger.warning(f'No abstract found for "{item["title"]}": {item["abstract_url"]}')
+            self.logger.warning(f'No abstract found for "{item.title}": {item.abstract_url}')
             return
 
         abstract = abstract.strip()
@@ -108,15 +108,15 @@ class TheCVFSpider(BaseSpider):
         abstract = self.clean_extra_whitespaces(abstract)
         abstract = self.clean_quotes(abstract)
 
-        item['title'] = self.clean_html_tags(item['title'])
-        item['title'] = self.clean_extra_whitespaces(item['title'])
-        item['title'] = self.clean_quotes(item['title'])
+        item.title = self.clean_html_tags(item.title)
+        item.title = self.clean_extra_whitespaces(item.title)
+        item.title = self.clean_quotes(item.title)
 
-        item['authors'] = response.xpath('//*[@id="authors"]/b/i/text()').get()
-        item['authors'] = item['authors'].strip()
+        item.authors = response.xpath('//*[@id="authors"]/b/i/text()').get()
+        item.authors = item.authors.strip()
 
         self.logger.debug(f'Abstract text: {abstract}')
         # might contain \r in abstract text, like \rightarrow
-        item['abstract'] = repr(abstract)
-        item['source_url'] = 9
+        item.abstract = repr(abstract)
+        item.source_url = 9
         yield item
@@ -1,8 +1,25 @@
 import re
 from pathlib import Path
 import scrapy
+from lxml import etree
+from scrapy.utils.response import get_base_url
+
 from .base_spider import BaseSpider
 from ..items import PdfFilesItem
+from ..utils import first, meta_xpath, urljoin_cached
+
+
+_XP_PAPERS = etree.XPath('//article[contains(@class,"node-paper")]')
+_XP_ARTICLES = etree.XPath('//article')
+_XP_H2_TEXTS = etree.XPath('//h2//text()', smart_strings=False)
+# relative to each paper block
+_XP_PAPER_TITLE = etree.XPath('.//h2/a/text()', smart_strings=False)
+_XP_PAPER_URL = etree.XPath('.//h2/a/@href', smart_strings=False)
+# text of the first <p> in the field, '' when there is none
+_XP_PAPER_AUTHORS = etree.XPath('string((.//div[contains(@class,"field-name-field-paper-people-text")]//p)[1])', smart_strings=False)
+_XP_PAPER_ABSTRACT = etree.XPath('string((.//div[contains(@class,"field-name-field-paper-description-long")]//p)[1])', smart_strings=False)
+_XP_PDF_URL = meta_xpath('@name="citation_pdf_url"')
+_XP_PDF_URL_FIELD = etree.XPath('//div[contains(@class,"field-name-field-final-paper-pdf")]//a/@href', smart_strings=False)
 
 
 class UsenixSpider(BaseSpider):
@@ -12,6 +29,14 @@ class UsenixSpider(BaseSpider):
         'https://www.usenix.org/conference/usenixsecurity24/summer-accepted-papers',
         'https://www.usenix.org/conference/usenixsecurity24/fall-accepted-papers'
     ]
+    custom_settings = {
+        'DUPEFILTER_CLASS': 'papers_scrapper.dupefilters.BloomRFPDupeFilter',
+        # keep the fetched pages for a day, so re-runs (e.g. after a failure) don't fetch them again
+        'HTTPCACHE_ENABLED': True,
+        'HTTPCACHE_EXPIRATION_SECS': 86400,
+        'HTTPCACHE_GZIP': True,
+        'HTTPCACHE_IGNORE_HTTP_CODES': [429, 500, 502, 503, 504],
+    }
 
     def __init__(self, conference: str = '', year: str = ''):
         BaseSpider.__init__(self, conference, year)
@@ -30,46 +55,47 @@ class UsenixSpider(BaseSpider):
         self.logger.info(f'Successfully fetched page: {response.url}')
         self.logger.info(f'Response status: {response.status}')
         
+        root = response.selector.root
+        base_url = get_base_url(response)
+
         # Find all paper blocks
-        papers = response.xpath('//article[contains(@class,"node-paper")]')
+        papers = _XP_PAPERS(root)
         self.logger.info(f'Found {len(papers)} paper blocks')
         
         if len(papers) == 0:
             self.logger.warning('No papers found! Checking page structure...')
             # Check if we can find any articles at all
-            all_articles = response.xpath('//article')
+            all_articles = _XP_ARTICLES(root)
             self.logger.info(f'Found {len(all_articles)} total articles')
             
             # Log some of the page content for debugging
-            titles = response.xpath('//h2//text()').getall()[:5]
+            titles = _XP_H2_TEXTS(root)[:5]
             self.logger.info(f'Sample titles found: {titles}')
         
         for paper in papers:
-            title = paper.xpath('.//h2/a/text()').get()
-            presentation_url = paper.xpath('.//h2/a/@href').get()
+            title = first(_XP_PAPER_TITLE(paper))
+            presentation_url = first(_XP_PAPER_URL(paper))
             
             self.logger.debug(f'Processing paper: {title}')
             
             # Extract authors from the people field
-            authors_html = paper.xpath('.//div[contains(@class,"field-name-field-paper-people-text")]//p').get()
-            authors = scrapy.Selector(text=authors_html).xpath('string(.)').get() if authors_html else ''
-            
+            authors = _XP_PAPER_AUTHORS(paper)
+
             # Extract abstract from description field
-            abstract_html = paper.xpath('.//div[contains(@class,"field-name-field-paper-description-long")]//p').get()
-            abstract = scrapy.Selector(text=abstract_html).xpath('string(.)').get() if abstract_html else ''
+            abstract = _XP_PAPER_ABSTRACT(paper)
 
             if presentation_url:
                 self.logger.info(f'Following presentation URL: {presentation_url}')
-                yield response.follow(
-                    presentation_url,
+                abstract_url = urljoin_cached(base_url, presentation_url)
+                yield scrapy.Request(
+                    url=abstract_url,
                     callback=self.parse_presentation,
                     meta={
                         'title': self.clean_html_tags(title) if title else '',
                         'authors': self.clean_html_tags(authors) if authors else '',
                         'abstract': self.clean_html_tags(abstract) if abstract else '',
-                        'abstract_url': response.urljoin(presentation_url)
-                    },
-                    dont_filter=True
+                        'abstract_url': abstract_url
+                    }
                 )
             else:
                 self.logger.warning(f'No presentation URL found for paper: {title}')
@@ -78,25 +104,27 @@ class UsenixSpider(BaseSpider):
         self.logger.info(f'Processing presentation page: {response.url}')
         
         # Try meta tag first for PDF URL
-        pdf_url = response.xpath('//meta[@name="citation_pdf_url"]/@content').get()
+        root = response.selector.root
+        pdf_url = first(_XP_PDF_URL(root))
         if not pdf_url:
             # Fallback: look for PDF link in the final paper field
-            pdf_url = response.xpath('//div[contains(@class,"field-name-field-final-paper-pdf")]//a/@href').get()
+            pdf_url = first(_XP_PDF_URL_FIELD(root))
         
         if pdf_url:
-            pdf_url = response.urljoin(pdf_url)
+            pdf_url = urljoin_cached(get_base_url(response), pdf_url)
             self.logger.info(f'Found PDF URL: {pdf_url}')
         else:
             self.logger.warning(f'No PDF URL found for: {response.url}')
 
-        item = PdfFilesItem()
-        item['title'] = response.meta['title']
-        item['authors'] = response.meta['authors']
-        item['abstract'] = response.meta['abstract']
-        item['abstract_url'] = response.meta['abstract_url']
-        item['pdf_url'] = pdf_url if pdf_url else ''
-        item['file_urls'] = [pdf_url] if pdf_url else []
-        item['source_url'] = 12  # USENIX
+        item = PdfFilesItem(
+            title=response.meta['title'],
+            authors=response.meta['authors'],
+            abstract=response.meta['abstract'],
+            abstract_url=response.meta['abstract_url'],
+            pdf_url=pdf_url if pdf_url else '',
+            file_urls=[pdf_url] if pdf_url else [],
+            source_url=12,  # USENIX
+        )
 
-        self.logger.info(f'Yielding item for: {item["title"]}')
+        self.logger.info(f'Yielding item for: {item.title}')
         yield item
\ No newline at end of file
@@ -0,0 +1,43 @@
+# Helpers shared by the spiders that query the parsed documents with pre-compiled
+# lxml XPath expressions instead of parsel selectors.
+
+from functools import lru_cache
+from urllib.parse import urljoin
+
+from lxml import etree
+from w3lib.html import strip_html5_whitespace
+
+
+def first(results: list, default=None):
+    # mimics parsel's SelectorList.get() on the list returned by a compiled XPath
+    return results[0] if results else default
+
+
+@lru_cache(maxsize=2048)
+def urljoin_cached(base: str, url: str) -> str:
+    # same as response.follow() does to hrefs before joining them
+    return urljoin(base, strip_html5_whitespace(url))
+
+
+def parse_with_target(response, target):
+    # feeds the page to an lxml parser target, which gets the parsing events (start, end, data, ...)
+    # instead of a tree being built, and returns what the target's close() returns
+    parser = etree.HTMLParser(target=target)
+    parser.feed(response.text)
+    return parser.close()
+
+
+def meta_xpath(predicate: str):
+    # for single-valued meta tags (the caller takes first()): they belong to <head>, but libxml2 closes
+    # <head> on the first element that can't be in it (e.g. a stray <div> or <iframe>), so the meta tags
+    # after it end up in <body>. Only the children of both are looked at, the whole document is searched
+    # only when that finds nothing (e.g. a meta tag inside an element left open). A multi-valued lookup
+    # must search the whole document, some values may be found by the first query and others not
+    in_head_or_body = etree.XPath(
+        f'/html/head/meta[{predicate}]/@content | /html/body/meta[{predicate}]/@content', smart_strings=False)
+    anywhere = etree.XPath(f'//meta[{predicate}]/@content', smart_strings=False)
+
+    def evaluate(root) -> list[str]:
+        return in_head_or_body(root) or anywhere(root)
+
+    return evaluate